@@ -10,13 +10,31 @@ import time
 import os
 import sys
 import json
+import io
+import functools
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
-from datetime import datetime
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.auth import HTTPBasicAuth
 import signal
 import getpass
+import select
+import shutil
+import queue
+import threading
+import collections
+
+# Optional: python-xlib enables event-driven clipboard monitoring (XFixes)
+try:
+    from Xlib import display as xdisplay
+    from Xlib import error as xerror
+    from Xlib.ext import xfixes
+except ImportError:
+    xdisplay = None
 
 def load_configuration():
     """Load configuration from JSON file"""
@@ -27,8 +45,7 @@ def load_configuration():
         sys.exit(1)
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(config_path.read_bytes())
     except json.JSONDecodeError as e:
         print(f"Failed to parse configuration file: {e}")
         sys.exit(1)
@@ -51,6 +68,62 @@ CONFIG = {
     'remote_folder': CONFIG_DATA['nextcloud']['remote_folder']
 }
 
+# Clipboard targets (X11 selection formats) we know how to handle
+IMAGE_TARGETS = frozenset(['image/png', 'image/jpeg', 'image/gif', 'image/bmp', 'image/tiff'])
+TEXT_TARGETS = frozenset(['UTF8_STRING', 'STRING', 'TEXT', 'text/plain', 'text/plain;charset=utf-8'])
+
+# Remote clipboard file naming: clipboard-<hostname>.txt / .png
+REMOTE_FILE_PREFIX = 'clipboard-'
+REMOTE_FILE_SUFFIXES = ('.txt', '.png')
+
+# WebDAV PROPFIND request bodies (pre-encoded, reused on every poll)
+PROPFIND_BODY_LISTING = b'''<?xml version="1.0" encoding="utf-8" ?>
+<D:propfind xmlns:D="DAV:">
+    <D:prop>
+        <D:displayname/>
+        <D:getlastmodified/>
+        <D:getetag/>
+    </D:prop>
+</D:propfind>'''
+
+PROPFIND_BODY_ETAG = b'''<?xml version="1.0" encoding="utf-8" ?>
+<D:propfind xmlns:D="DAV:">
+    <D:prop>
+        <D:getetag/>
+    </D:prop>
+</D:propfind>'''
+
+# Clark-notation tags and property paths for parsing PROPFIND responses
+DAV_RESPONSE = '{DAV:}response'
+DAV_DISPLAYNAME = '{DAV:}propstat/{DAV:}prop/{DAV:}displayname'
+DAV_LASTMODIFIED = '{DAV:}propstat/{DAV:}prop/{DAV:}getlastmodified'
+DAV_ETAG = '{DAV:}propstat/{DAV:}prop/{DAV:}getetag'
+
+# Local capture file name prefixes (only these files are rotated by max_history)
+CAPTURE_FILE_PREFIXES = ('clipboard_text_', 'clipboard_image_')
+
+# WebDAV request timeout (connect, read) in seconds - short connect so an unreachable
+# server doesn't stall the main loop
+HTTP_TIMEOUT = (3, 10)
+# Idempotent WebDAV methods used here - safe to resend after a dropped connection
+RETRY_METHODS = frozenset(['PROPFIND', 'GET', 'PUT'])
+
+# Clipboard poll interval when XFixes events are not available
+CLIPBOARD_POLL_INTERVAL = 0.5  # seconds
+# Maximum pending background uploads (oldest is dropped when full)
+UPLOAD_QUEUE_SIZE = 8
+# How long to wait for pending uploads on shutdown
+UPLOAD_DRAIN_TIMEOUT = 10  # seconds
+
+# In event mode, re-read the clipboard at least this often to recover from missed events
+CLIPBOARD_WATCHDOG_INTERVAL = 5  # seconds
+# After an owner change, wait this long for follow-up events so a burst is handled with one read
+CLIPBOARD_EVENT_DEBOUNCE = 0.05  # seconds
+# Adaptive remote polling: after this many idle checks in a row the interval doubles,
+# up to REMOTE_CHECK_BACKOFF_MAX times the configured interval
+REMOTE_IDLE_CHECKS_BEFORE_BACKOFF = 5
+REMOTE_CHECK_BACKOFF_MAX = 4
+
 def get_password_if_needed():
     """Prompt for password if not configured"""
     if not CONFIG['password'].strip():
@@ -62,6 +135,39 @@ def get_password_if_needed():
         CONFIG['password'] = password
         print("Password configured successfully.")
 
+@functools.lru_cache(maxsize=256)
+def parse_webdav_date(raw):
+    """Parse an RFC 1123 WebDAV date (e.g. 'Tue, 15 Oct 2024 10:00:00 GMT') to local time.
+    Results are cached: unchanged files report the same string on every poll."""
+    try:
+        return parsedate_to_datetime(raw).astimezone()
+    except (TypeError, ValueError):
+        return None
+
+def log_time():
+    """Current local time (HH:MM:SS) for log lines"""
+    return time.strftime('%H:%M:%S')
+
+def text_preview(data, length=50):
+    """Short notification preview of clipboard text bytes (decodes only the prefix)"""
+    text = data[:length * 4].decode('utf-8', errors='ignore')
+    if len(text) > length or len(data) > length * 4:
+        return text[:length] + "..."
+    return text
+
+def write_file_atomic(path, data):
+    """Write bytes to a temp file and rename it into place, so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    # Raw fd I/O: no Python io/buffering layer for a single write
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 class ClipSon:
     def __init__(self):
         # Get password if needed before setting up WebDAV
@@ -70,35 +176,99 @@ class ClipSon:
         self.hostname = os.uname().nodename
         self.output_dir = Path(f'./clipboard-captures')
         self.output_dir.mkdir(exist_ok=True)
+        # Precomputed capture file name prefixes (avoid Path joins per capture)
+        self.text_capture_prefix = os.path.join(str(self.output_dir), CAPTURE_FILE_PREFIXES[0])
+        self.image_capture_prefix = os.path.join(str(self.output_dir), CAPTURE_FILE_PREFIXES[1])
         
         self.max_history = CONFIG_DATA['app']['max_history']
         self.file_counter = 0
-        self.last_clipboard_content = ""
+        # Capture files, oldest first - scanned once here, then maintained per capture
+        self.capture_history = collections.deque(self.scan_capture_files())
+        self.last_clipboard_content = b""  # Raw bytes of the last captured/applied clipboard content
+        self.last_image_data = None  # Bytes of the last captured/applied clipboard image
         self.remote_file_timestamps = {}  # Track timestamps for each remote file
+        self.remote_file_etags = {}  # Track last seen ETag for each remote file
+        self.remote_folder_etag = None  # ETag of the remote folder at the last full listing
         self.last_remote_check = 0
         self.remote_check_interval = CONFIG_DATA['app']['remote_check_interval_seconds']  # seconds
+        self.remote_poll_interval = self.remote_check_interval  # Current (adaptive) interval
+        self.remote_idle_checks = 0
         
         # WebDAV setup
         self.webdav_base_url = f"{CONFIG['server_url'].rstrip('/')}/remote.php/dav/files/{CONFIG['username']}/"
+        self.remote_folder_url = f"{self.webdav_base_url}{CONFIG['remote_folder']}"
         self.auth = HTTPBasicAuth(CONFIG['username'], CONFIG['password'])
         
+        # Persistent HTTP session: reuses TCP/TLS connections (keep-alive) across polls
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        # Retry once, at most: a failed connect, or a pooled keep-alive socket the server closed on
+        # reuse (urllib3 reports that as a read error). PROPFIND/GET/PUT are idempotent, so a single
+        # read retry is safe; total=1 keeps an unreachable server to two short connect timeouts.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=1, connect=1, read=1, status=0,
+                                                allowed_methods=RETRY_METHODS, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Persistent worker pool for concurrent peer downloads (shares the session's connection pool)
+        self.io_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Background uploader so network round trips don't block clipboard monitoring
+        self.upload_queue = queue.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        threading.Thread(target=self.upload_worker, daemon=True).start()
+        
         # File paths
-        self.local_sync_file = Path(f'./clipboard-{self.hostname}.txt')
         self.local_upload_file = f"clipboard-{self.hostname}.txt"
+        self.local_upload_image_file = f"clipboard-{self.hostname}.png"
+        self.own_remote_files = frozenset([self.local_upload_file, self.local_upload_image_file])
+        
+        # X11 connection for clipboard owner-change events (None = fall back to polling)
+        self.x_display = self.setup_clipboard_watcher()
+        self.last_clipboard_read = time.monotonic()
+        self.last_selection_owner = None  # (owner window, selection timestamp) of the last owner change
+        self.selection_owner_changed = False  # Last wait ended on a real XFixes owner change
         
         # Setup signal handler
         signal.signal(signal.SIGINT, self.signal_handler)
     
+    def scan_capture_files(self):
+        """List capture files written by ClipSon in output_dir, oldest first"""
+        captures = []
+        for entry in os.scandir(self.output_dir):
+            # Only our own captures - never rotate out files we didn't write
+            if not entry.name.startswith(CAPTURE_FILE_PREFIXES) or entry.name.endswith('.tmp'):
+                continue
+            try:
+                if entry.is_file():
+                    captures.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass  # Removed during the scan
+        captures.sort()
+        return [path for _, path in captures]
+    
     def signal_handler(self, signum, frame):
+        self.drain_uploads(UPLOAD_DRAIN_TIMEOUT)
         print("\nClipSon stopped.")
         sys.exit(0)
     
+    def drain_uploads(self, timeout):
+        """Wait (bounded) for queued uploads to finish so a last-second capture still reaches the server"""
+        # Poll instead of Queue.join(): the handler may interrupt code holding the queue lock
+        deadline = time.monotonic() + timeout
+        if self.upload_queue.unfinished_tasks:
+            print(f"\nWaiting for {self.upload_queue.unfinished_tasks} pending upload(s)...")
+        while self.upload_queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.1)
+        if self.upload_queue.unfinished_tasks:
+            print(f"Gave up on {self.upload_queue.unfinished_tasks} pending upload(s)")
+    
     def check_dependencies(self):
         """Check if required system dependencies are available"""
         missing_deps = []
         
         for cmd in ['xclip', 'notify-send']:
-            if subprocess.run(['which', cmd], capture_output=True).returncode != 0:
+            if shutil.which(cmd) is None:
                 missing_deps.append(cmd)
         
         if missing_deps:
@@ -117,30 +287,106 @@ class ClipSon:
             print(f"NOTIFICATION: {title} - {message}")
     
     def get_clipboard_content(self):
-        """Get current clipboard content (text only)"""
+        """Get current clipboard content (text only) as raw UTF-8 bytes"""
         try:
             result = subprocess.run(['xclip', '-selection', 'clipboard', '-o'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
+                                  capture_output=True)
+            # isspace() is False for empty input and avoids copying the content like strip() would
+            if result.returncode == 0 and result.stdout and not result.stdout.isspace():
                 return result.stdout
         except Exception:
             pass
         return None
 
-    def has_clipboard_image(self):
-        """Check if clipboard contains an image"""
+    def setup_clipboard_watcher(self):
+        """Subscribe to XFixes CLIPBOARD owner-change events, return display or None"""
+        if xdisplay is None:
+            return None
+        try:
+            d = xdisplay.Display()
+            if not d.has_extension('XFIXES'):
+                d.close()
+                return None
+            d.xfixes_query_version()
+            clipboard_atom = d.intern_atom('CLIPBOARD')
+            d.xfixes_select_selection_input(d.screen().root, clipboard_atom,
+                                            xfixes.XFixesSetSelectionOwnerNotifyMask)
+            return d
+        except Exception as e:
+            if DEBUG:
+                print(f"DEBUG: XFixes clipboard watcher unavailable: {e}")
+            return None
+
+    def wait_for_clipboard_change(self):
+        """Wait for a clipboard change or the next remote check, return True if clipboard should be read"""
+        self.selection_owner_changed = False
+        if self.x_display is None:
+            time.sleep(CLIPBOARD_POLL_INTERVAL)
+            return True
+        
+        # Block on the X connection until an event arrives, the next remote check or the watchdog is due
+        deadline = min(self.last_remote_check + self.remote_poll_interval,
+                       self.last_clipboard_read + CLIPBOARD_WATCHDOG_INTERVAL)
+        timeout = max(0, deadline - time.monotonic())
+        try:
+            if not self.x_display.pending_events():
+                select.select([self.x_display], [], [], timeout)
+            changed = self.process_clipboard_events()
+            
+            # Debounce: apps that re-claim the selection several times in a row trigger a single read
+            if changed:
+                select.select([self.x_display], [], [], CLIPBOARD_EVENT_DEBOUNCE)
+                self.process_clipboard_events()
+        except (xerror.ConnectionClosedError, OSError) as e:
+            print(f"X11 clipboard watcher failed ({e}), falling back to polling")
+            try:
+                self.x_display.close()
+            except Exception:
+                pass
+            self.x_display = None
+            return True
+        self.selection_owner_changed = changed
+        
+        # Watchdog: re-read periodically even without events
+        if time.monotonic() - self.last_clipboard_read >= CLIPBOARD_WATCHDOG_INTERVAL:
+            changed = True
+        if changed:
+            self.last_clipboard_read = time.monotonic()
+        return changed
+
+    def process_clipboard_events(self):
+        """Drain queued X events, return True if the CLIPBOARD owner changed"""
+        changed = False
+        owner_notify = self.x_display.extension_event.SetSelectionOwnerNotify
+        while self.x_display.pending_events():
+            event = self.x_display.next_event()
+            # Core events (e.g. MappingNotify on keyboard changes) have no sub_code
+            if (event.type, getattr(event, 'sub_code', None)) == owner_notify:
+                # Ignore repeated notifications for the same owner and selection timestamp
+                selection_owner = (getattr(event.owner, 'id', event.owner), event.selection_timestamp)
+                if selection_owner != self.last_selection_owner:
+                    self.last_selection_owner = selection_owner
+                    changed = True
+        return changed
+
+    def get_clipboard_targets(self):
+        """Get the set of targets offered by the clipboard owner (None if unknown)"""
         try:
-            # Check if clipboard has image data
             result = subprocess.run(['xclip', '-selection', 'clipboard', '-t', 'TARGETS', '-o'], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
-                targets = result.stdout.strip().split('\n')
-                # Look for image MIME types
-                image_targets = ['image/png', 'image/jpeg', 'image/gif', 'image/bmp', 'image/tiff']
-                return any(target.strip() in image_targets for target in targets)
+                return set(result.stdout.split())
         except Exception:
             pass
-        return False
+        return None
+
+    def has_clipboard_image(self, targets):
+        """Check if clipboard targets include an image"""
+        return targets is not None and not IMAGE_TARGETS.isdisjoint(targets)
+
+    def has_clipboard_text(self, targets):
+        """Check if clipboard targets include text (assume yes when targets are unknown)"""
+        return targets is None or not TEXT_TARGETS.isdisjoint(targets)
 
     def save_clipboard_image(self):
         """Save clipboard image to file and upload"""
@@ -150,38 +396,33 @@ class ClipSon:
                                   capture_output=True)
             
             if result.returncode == 0 and result.stdout:
-                # Calculate hash from image data
-                import hashlib
-                current_image_hash = hashlib.md5(result.stdout).hexdigest()
-                
-                # Check if this is the same image as last time
-                if hasattr(self, 'last_image_hash') and current_image_hash == self.last_image_hash:
+                # Check if this is the same image as last time (bytes equality compares
+                # lengths first and stops at the first differing byte - no full hash pass)
+                if result.stdout == self.last_image_data:
                     if DEBUG:
-                        print(f"DEBUG: Image hash matches previous - skipping save and upload")
+                        print(f"DEBUG: Image matches previous - skipping save and upload")
                     return False
                 
-                # Hash is different, proceed with saving
+                # Image is different, proceed with saving
                 file_number = self.get_next_file_number()
-                filename = self.output_dir / f"clipboard_image_{file_number:03d}.png"
+                filename = f"{self.image_capture_prefix}{file_number:03d}.png"
                 
-                with open(filename, 'wb') as f:
-                    f.write(result.stdout)
+                write_file_atomic(filename, result.stdout)
+                self.record_capture(filename)
                 
-                print(f"{datetime.now().strftime('%H:%M:%S')} - Image saved: {filename}")
+                print(f"{log_time()} - Image saved: {filename}")
                 
-                # Update hash tracking
-                self.last_image_hash = current_image_hash
+                # Update image tracking
+                self.last_image_data = result.stdout
                 
                 # Upload image to WebDAV (use hostname-based file name)
-                remote_image_file = f"clipboard-{self.hostname}.png"
-                if self.upload_to_webdav(filename, remote_image_file):
-                    print(f"{datetime.now().strftime('%H:%M:%S')} - Uploaded image to WebDAV: {remote_image_file}")
+                self.queue_upload(result.stdout, self.local_upload_image_file)
                 
                 # Show notification
                 self.show_notification("ClipSon", f"Image captured: {filename}")
                 
                 # Update last clipboard content to prevent re-capture
-                self.last_clipboard_content = f"__IMAGE_CONTENT_{len(result.stdout)}_BYTES__"
+                self.last_clipboard_content = b"__IMAGE_CONTENT_%d_BYTES__" % len(result.stdout)
                 
                 return True
         except Exception as e:
@@ -191,86 +432,101 @@ class ClipSon:
     def test_webdav_connection(self):
         """Test WebDAV connection"""
         try:
-            response = requests.request('PROPFIND', self.webdav_base_url, 
-                                      auth=self.auth, headers={'Depth': '0'}, 
-                                      timeout=10)
+            response = self.session.request('PROPFIND', self.webdav_base_url, 
+                                            headers={'Depth': '0'}, 
+                                            timeout=HTTP_TIMEOUT)
             return response.status_code == 207
         except Exception as e:
             print(f"Failed to connect to Nextcloud: {e}")
             return False
     
+    def get_remote_folder_etag(self):
+        """Get the remote folder ETag (Nextcloud changes it whenever a file inside changes).
+        Connection errors propagate so the caller can skip the rest of the remote check."""
+        webdav_url = self.remote_folder_url
+        response = self.session.request('PROPFIND', webdav_url,
+                                        headers={'Content-Type': 'application/xml', 'Depth': '0'},
+                                        data=PROPFIND_BODY_ETAG,
+                                        timeout=HTTP_TIMEOUT)
+        try:
+            if response.status_code == 207:
+                return ET.fromstring(response.content).findtext(f'{DAV_RESPONSE}/{DAV_ETAG}') or None
+        except ET.ParseError:
+            pass
+        return None
+    
     def get_remote_clipboard_files(self):
-        """Discover remote clipboard files"""
+        """Discover remote clipboard files, return (files, folder ETag) - files is None on failure"""
         try:
-            webdav_url = f"{self.webdav_base_url}{CONFIG['remote_folder']}"
-            
-            propfind_body = '''<?xml version="1.0" encoding="utf-8" ?>
-<D:propfind xmlns:D="DAV:">
-    <D:prop>
-        <D:displayname/>
-        <D:getlastmodified/>
-    </D:prop>
-</D:propfind>'''
+            webdav_url = self.remote_folder_url
             
-            response = requests.request('PROPFIND', webdav_url,
-                                      auth=self.auth,
-                                      headers={'Content-Type': 'application/xml', 'Depth': '1'},
-                                      data=propfind_body,
-                                      timeout=10)
+            response = self.session.request('PROPFIND', webdav_url,
+                                            headers={'Content-Type': 'application/xml', 'Depth': '1'},
+                                            data=PROPFIND_BODY_LISTING,
+                                            timeout=HTTP_TIMEOUT)
             
             if response.status_code != 207:
                 print(f"Failed to discover remote clipboard files: {response.status_code} {response.reason}")
                 if DEBUG:
                     print(f"DEBUG: Response text: {response.text}")
-                return []                    
+                return None, None
             
-            # Parse XML response
-            root = ET.fromstring(response.text)
+            # Stream-parse the raw response bytes, handling each <D:response> once it is complete
             files = []
+            folder_etag = None
+            first_response = True
             
-            for response_elem in root.findall('.//{DAV:}response'):
-                displayname_elem = response_elem.find('.//{DAV:}displayname')
-                lastmodified_elem = response_elem.find('.//{DAV:}getlastmodified')
+            for _, response_elem in ET.iterparse(io.BytesIO(response.content)):
+                if response_elem.tag != DAV_RESPONSE:
+                    continue
+                
+                displayname = response_elem.findtext(DAV_DISPLAYNAME)
+                lastmodified = response_elem.findtext(DAV_LASTMODIFIED)
+                etag = response_elem.findtext(DAV_ETAG)
+                # Values are extracted, free the subtree
+                response_elem.clear()
+                
+                # The first entry is the collection itself - its ETag changes whenever a file inside changes
+                if first_response:
+                    first_response = False
+                    folder_etag = etag or None
+                    continue
                 
-                if displayname_elem is not None and displayname_elem.text:
-                    filename = displayname_elem.text
-                    if filename.startswith('clipboard-') and (filename.endswith('.txt') or filename.endswith('.png')):
-                        last_modified = None
-                        if lastmodified_elem is not None and lastmodified_elem.text:
-                            try:
-                                from datetime import timezone
-                                # Parse without timezone first, then make it UTC
-                                dt_str = lastmodified_elem.text.replace(' GMT', '')
-                                last_modified_utc = datetime.strptime(dt_str, '%a, %d %b %Y %H:%M:%S')
-                                # Make it UTC aware
-                                last_modified_utc = last_modified_utc.replace(tzinfo=timezone.utc)
-                                # Convert to local time
-                                last_modified = last_modified_utc.astimezone()
-                            except ValueError:
-                                pass
+                if displayname:
+                    filename = displayname
+                    if filename.startswith(REMOTE_FILE_PREFIX) and filename.endswith(REMOTE_FILE_SUFFIXES):
+                        last_modified = parse_webdav_date(lastmodified) if lastmodified else None
                         
                         files.append({
                             'name': filename,
-                            'last_modified': last_modified
+                            'last_modified': last_modified,
+                            'timestamp': last_modified.timestamp() if last_modified else 0,
+                            'etag': etag or None
                         })
             
-            return files
+            return files, folder_etag
         except Exception as e:
             print(f"Failed to discover remote clipboard files: {e}")
-            return []
+            return None, None
     
     def discover_remote_peers(self):
         """Discover and track all remote clipboard files"""
         print("Discovering remote clipboard files...")
-        remote_files = self.get_remote_clipboard_files()
+        remote_files, folder_etag = self.get_remote_clipboard_files()
+        # This listing seeds the tracking below and the folder ETag, so the first update check
+        # can wait a full interval and then only needs the cheap Depth:0 probe
+        self.last_remote_check = time.monotonic()
+        if remote_files is None:
+            remote_files = []
+        else:
+            self.remote_folder_etag = folder_etag
         
         # Filter out our own files (both text and image)
-        base = f"clipboard-{self.hostname}"
-        peer_files = [f for f in remote_files if f['name'] not in (f"{base}.txt", f"{base}.png")]
+        peer_files = [f for f in remote_files if f['name'] not in self.own_remote_files]
         
         if not peer_files:
             print("No remote clipboard files from other machines found.")
-            print(f"Will only upload to: {base}.txt and {base}.png")
+            print(f"Will only upload to: {self.local_upload_file} and {self.local_upload_image_file}")
             return []
         
         print(f"\nFound {len(peer_files)} remote peer(s):")
@@ -279,99 +535,106 @@ class ClipSon:
             print(f"  - {file_info['name']} (Modified: {time_str})")
             
             # Initialize timestamp tracking
-            if file_info['last_modified']:
-                self.remote_file_timestamps[file_info['name']] = file_info['last_modified'].timestamp()
-            else:
-                self.remote_file_timestamps[file_info['name']] = 0
+            self.remote_file_timestamps[file_info['name']] = file_info['timestamp']
+            self.remote_file_etags[file_info['name']] = file_info['etag']
         
         return [f['name'] for f in peer_files]
     
-    def get_remote_file_timestamp(self, remote_file):
-        """Get remote file timestamp"""
-        try:
-            webdav_url = f"{self.webdav_base_url}{CONFIG['remote_folder']}{remote_file}"
-            
-            propfind_body = '''<?xml version="1.0" encoding="utf-8" ?>
-<D:propfind xmlns:D="DAV:">
-    <D:prop>
-        <D:getlastmodified/>
-    </D:prop>
-</D:propfind>'''
-            
-            response = requests.request('PROPFIND', webdav_url,
-                                      auth=self.auth,
-                                      headers={'Content-Type': 'application/xml', 'Depth': '0'},
-                                      data=propfind_body,
-                                      timeout=10)
-            
-            if response.status_code == 207:
-                root = ET.fromstring(response.text)
-                lastmodified_elem = root.find('.//{DAV:}getlastmodified')
-                if lastmodified_elem is not None and lastmodified_elem.text:
-                    from datetime import timezone
-                    # Parse without timezone first, then make it UTC
-                    dt_str = lastmodified_elem.text.replace(' GMT', '')
-                    last_modified_utc = datetime.strptime(dt_str, '%a, %d %b %Y %H:%M:%S')
-                    # Make it UTC aware
-                    last_modified_utc = last_modified_utc.replace(tzinfo=timezone.utc)
-                    # Convert to local time
-                    return last_modified_utc.astimezone()
-        except Exception:
-            pass
-        return None
-    
-    def download_remote_file(self, remote_file, local_file):
-        """Download remote file"""
+    def download_remote_file(self, remote_file):
+        """Download remote file content (bytes), None on failure"""
         try:
-            webdav_url = f"{self.webdav_base_url}{CONFIG['remote_folder']}{remote_file}"
-            response = requests.get(webdav_url, auth=self.auth, timeout=10)
+            webdav_url = self.remote_folder_url + remote_file
+            response = self.session.get(webdav_url, timeout=HTTP_TIMEOUT)
             
             if response.status_code == 200:
-                if local_file.endswith('.png'):
-                    with open(local_file, 'wb') as f:
-                        f.write(response.content)
-                else:
-                    with open(local_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                return True
+                return response.content
         except Exception:
             pass
-        return False
+        return None
     
-    def upload_to_webdav(self, local_file, remote_file):
-        """Upload file to WebDAV"""
+    def upload_to_webdav(self, data, remote_file):
+        """Upload in-memory content (bytes) to WebDAV"""
         try:
-            webdav_url = f"{self.webdav_base_url}{CONFIG['remote_folder']}{remote_file}"
+            webdav_url = self.remote_folder_url + remote_file
             
-            with open(local_file, 'rb') as f:
-                response = requests.put(webdav_url, auth=self.auth, data=f, timeout=10)
+            response = self.session.put(webdav_url, data=data, timeout=HTTP_TIMEOUT)
             
             if response.status_code in [201, 204]:
-                print(f"{datetime.now().strftime('%H:%M:%S')} - Uploaded to WebDAV: {remote_file}")
+                print(f"{log_time()} - Uploaded to WebDAV: {remote_file}")
                 return True
             else:
-                print(f"{datetime.now().strftime('%H:%M:%S')} - Error uploading to WebDAV: {remote_file}")
+                print(f"{log_time()} - Error uploading to WebDAV: {remote_file}")
                 return False
         except Exception as e:
-            print(f"{datetime.now().strftime('%H:%M:%S')} - Error uploading to WebDAV: {e}")
+            print(f"{log_time()} - Error uploading to WebDAV: {e}")
             return False
     
+    def queue_upload(self, data, remote_file):
+        """Queue content for background upload, dropping the oldest pending upload if full"""
+        # Local clipboard activity - peers are likely active too, poll at the full rate again
+        self.update_remote_poll_interval(True)
+        while True:
+            try:
+                self.upload_queue.put_nowait((data, remote_file))
+                return
+            except queue.Full:
+                try:
+                    self.upload_queue.get_nowait()
+                    self.upload_queue.task_done()
+                except queue.Empty:
+                    pass
+    
+    def upload_worker(self):
+        """Background thread: upload queued content to WebDAV in order"""
+        while True:
+            data, remote_file = self.upload_queue.get()
+            try:
+                self.upload_to_webdav(data, remote_file)
+            finally:
+                self.upload_queue.task_done()
+    
     def check_all_remote_files_for_updates(self):
         """Check all remote files for updates and return the most recent one"""
-        current_time = time.time()
-        if current_time - self.last_remote_check < self.remote_check_interval:
+        # Monotonic clock: interval gating is unaffected by wall-clock jumps (NTP, suspend)
+        current_time = time.monotonic()
+        if current_time - self.last_remote_check < self.remote_poll_interval:
             return None
         
         self.last_remote_check = current_time
         
+        # Cheap Depth:0 check first - skip the full listing while the folder ETag is unchanged
+        try:
+            folder_etag = self.get_remote_folder_etag()
+        except requests.exceptions.RequestException as e:
+            # Server unreachable - don't block the main loop on a listing that would fail the same way
+            print(f"{log_time()} - Remote check failed: {e}")
+            self.update_remote_poll_interval(False)
+            return None
+        if folder_etag and folder_etag == self.remote_folder_etag:
+            self.update_remote_poll_interval(False)
+            return None
+        
         # Get current list of remote files
-        remote_files = self.get_remote_clipboard_files()
-        base = f"clipboard-{self.hostname}"
-        peer_files = [f for f in remote_files if f['name'] not in (f"{base}.txt", f"{base}.png")]
+        remote_files, listing_etag = self.get_remote_clipboard_files()
+        if remote_files is None:
+            self.update_remote_poll_interval(False)
+            return None
+        # Prefer the collection ETag from the listing itself - it matches exactly what was listed
+        self.remote_folder_etag = listing_etag or folder_etag
+        peer_files = [f for f in remote_files if f['name'] not in self.own_remote_files]
+        
+        # Forget peers whose files were removed from the server so tracking doesn't grow forever
+        listed = {f['name'] for f in peer_files}
+        for filename in self.remote_file_timestamps.keys() - listed:
+            del self.remote_file_timestamps[filename]
+            self.remote_file_etags.pop(filename, None)
+            if DEBUG:
+                print(f"DEBUG: Remote peer removed: {filename}")
         
         most_recent_content = None
         most_recent_timestamp = 0
         most_recent_filename = None
+        updated_files = []  # (filename, remote_timestamp, etag) to download
         
         for file_info in peer_files:
             filename = file_info['name']
@@ -382,7 +645,7 @@ class ClipSon:
             if is_new_file:
                 if file_info['last_modified']:
                     self.remote_file_timestamps[filename] = 0  # Set to 0 so it will be processed as an update
-                    print(f"{datetime.now().strftime('%H:%M:%S')} - New remote peer discovered: {filename}")
+                    print(f"{log_time()} - New remote peer discovered: {filename}")
                 else:
                     self.remote_file_timestamps[filename] = 0
                     continue
@@ -390,46 +653,56 @@ class ClipSon:
             if not file_info['last_modified']:
                 continue
                 
-            remote_timestamp = file_info['last_modified'].timestamp()
+            remote_timestamp = file_info['timestamp']
             last_known_timestamp = self.remote_file_timestamps[filename]
             
             # Check if this file has been updated (or is newly discovered)
             if remote_timestamp > last_known_timestamp:
+                # Unchanged ETag means the content is the same - skip the download
+                etag = file_info['etag']
+                if etag and etag == self.remote_file_etags.get(filename):
+                    if DEBUG:
+                        print(f"DEBUG: ETag unchanged for {filename} - skipping download")
+                    self.remote_file_timestamps[filename] = remote_timestamp
+                    continue
+                
                 if not is_new_file:
-                    print(f"{datetime.now().strftime('%H:%M:%S')} - Remote file updated: {filename}")
+                    print(f"{log_time()} - Remote file updated: {filename}")
+                
+                updated_files.append((filename, remote_timestamp, etag))
+        
+        # Download all updated files concurrently, in memory
+        downloads = [self.io_pool.submit(self.download_remote_file, filename) for filename, _, _ in updated_files]
+        
+        for (filename, remote_timestamp, etag), download in zip(updated_files, downloads):
+            body = download.result()
+            if body is None:
+                # Force a full listing next time so the failed download is retried
+                self.remote_folder_etag = None
+                continue
+            
+            try:
+                if filename.endswith('.txt'):
+                    # Normalize line endings like text-mode reads did (peers may send CRLF)
+                    file_content = body.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                    has_content = file_content and not file_content.isspace()
+                elif filename.endswith('.png'):
+                    file_content = body
+                    has_content = len(file_content) > 0
+                else:
+                    has_content = False
                 
-                # Download and check if it's the most recent
-                file_ext = Path(filename).suffix
-                temp_download_file = f'./temp-remote-download-{filename.replace(file_ext, "")}{file_ext}'
+                # Check if it's the most recent
+                if has_content and remote_timestamp > most_recent_timestamp:
+                    most_recent_content = file_content
+                    most_recent_timestamp = remote_timestamp
+                    most_recent_filename = filename
                 
-                if self.download_remote_file(filename, temp_download_file):
-                    try:
-                        if file_ext == '.txt':
-                            with open(temp_download_file, 'r', encoding='utf-8') as f:
-                                file_content = f.read()
-                            has_content = file_content.strip()
-                        elif file_ext == '.png':
-                            with open(temp_download_file, 'rb') as f:
-                                file_content = f.read()
-                            has_content = len(file_content) > 0
-                        else:
-                            has_content = False
-                        
-                        if has_content and remote_timestamp > most_recent_timestamp:
-                            most_recent_content = file_content
-                            most_recent_timestamp = remote_timestamp
-                            most_recent_filename = filename
-                        
-                        # Update timestamp regardless
-                        self.remote_file_timestamps[filename] = remote_timestamp
-                        
-                        os.remove(temp_download_file)
-                    except Exception as e:
-                        print(f"Error processing {filename}: {e}")
-                        try:
-                            os.remove(temp_download_file)
-                        except:
-                            pass
+                # Update timestamp and ETag regardless
+                self.remote_file_timestamps[filename] = remote_timestamp
+                self.remote_file_etags[filename] = etag
+            except Exception as e:
+                print(f"Error processing {filename}: {e}")
         
         # Apply the most recent update if found
         if most_recent_content:
@@ -438,21 +711,41 @@ class ClipSon:
                 if self.set_clipboard_image(most_recent_content):
                     self.show_notification("ClipSon", f"Remote image update from {most_recent_filename}")
                     # Use the binary content as our "last clipboard content" to prevent re-upload
-                    self.last_clipboard_content = f"__IMAGE_CONTENT_{len(most_recent_content)}_BYTES__"
+                    self.last_clipboard_content = b"__IMAGE_CONTENT_%d_BYTES__" % len(most_recent_content)
                 else:
                     self.show_notification("ClipSon", f"Remote image update from {most_recent_filename} (clipboard set failed, saved locally)")
-                    self.last_clipboard_content = f"__IMAGE_CONTENT_{len(most_recent_content)}_BYTES__"
+                    self.last_clipboard_content = b"__IMAGE_CONTENT_%d_BYTES__" % len(most_recent_content)
             else:
                 if self.set_clipboard_content(most_recent_content):
                     # Show notification
-                    preview = most_recent_content[:50] + "..." if len(most_recent_content) > 50 else most_recent_content
+                    preview = text_preview(most_recent_content)
                     self.show_notification("ClipSon", f"Remote update from {most_recent_filename}: {preview}")
                     self.last_clipboard_content = most_recent_content  # Prevent re-capture of this content
             
+            self.update_remote_poll_interval(True)
             return most_recent_content
         
+        self.update_remote_poll_interval(False)
         return None
     
+    def update_remote_poll_interval(self, active):
+        """Back off remote polling while idle, return to the configured interval on activity"""
+        if active:
+            if self.remote_poll_interval != self.remote_check_interval and DEBUG:
+                print(f"DEBUG: Remote check interval reset to {self.remote_check_interval}s")
+            self.remote_idle_checks = 0
+            self.remote_poll_interval = self.remote_check_interval
+            return
+        
+        self.remote_idle_checks += 1
+        if self.remote_idle_checks >= REMOTE_IDLE_CHECKS_BEFORE_BACKOFF:
+            self.remote_idle_checks = 0
+            max_interval = self.remote_check_interval * REMOTE_CHECK_BACKOFF_MAX
+            if self.remote_poll_interval < max_interval:
+                self.remote_poll_interval = min(self.remote_poll_interval * 2, max_interval)
+                if DEBUG:
+                    print(f"DEBUG: Remote idle - check interval backed off to {self.remote_poll_interval}s")
+    
     def get_next_file_number(self):
         """Get next file number for rotation"""
         self.file_counter += 1
@@ -460,32 +753,41 @@ class ClipSon:
             self.file_counter = 1
         return self.file_counter
     
-    def save_clipboard_text(self, content):
-        """Save clipboard text to numbered file and upload"""
+    def record_capture(self, filename):
+        """Add a capture file to the history and delete the oldest files beyond max_history"""
+        if filename in self.capture_history:
+            # File number was reused - the file was overwritten in place
+            self.capture_history.remove(filename)
+        self.capture_history.append(filename)
+        
+        while len(self.capture_history) > self.max_history:
+            try:
+                os.remove(self.capture_history.popleft())
+            except OSError:
+                pass
+    
+    def save_clipboard_text(self, data):
+        """Save clipboard text (raw UTF-8 bytes) to numbered file and upload"""
         # Save to numbered file
         file_number = self.get_next_file_number()
-        filename = self.output_dir / f"clipboard_text_{file_number:03d}.txt"
+        filename = f"{self.text_capture_prefix}{file_number:03d}.txt"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_file_atomic(filename, data)
+        self.record_capture(filename)
         
-        print(f"{datetime.now().strftime('%H:%M:%S')} - Text saved: {filename}")
+        print(f"{log_time()} - Text saved: {filename}")
         
-        # Save to local sync file and upload
-        with open(self.local_sync_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        self.upload_to_webdav(self.local_sync_file, self.local_upload_file)
+        # Upload straight from memory in the background (no intermediate sync file)
+        self.queue_upload(data, self.local_upload_file)
         
         # Show notification
-        preview = content[:50] + "..." if len(content) > 50 else content
-        self.show_notification("ClipSon", f"Captured: {preview}")
+        self.show_notification("ClipSon", f"Captured: {text_preview(data)}")
     
     def set_clipboard_content(self, content):
-        """Set clipboard content"""
+        """Set clipboard text content (raw UTF-8 bytes)"""
         try:
             subprocess.run(['xclip', '-selection', 'clipboard'], 
-                          input=content, text=True, check=True)
+                          input=content, check=True)
             return True
         except Exception:
             return False
@@ -493,11 +795,10 @@ class ClipSon:
     def set_clipboard_image(self, image_data):
         """Set clipboard image content"""
         try:
-            # Update hash tracking immediately to prevent re-capture
-            import hashlib
-            self.last_image_hash = hashlib.md5(image_data).hexdigest()
+            # Update image tracking immediately to prevent re-capture
+            self.last_image_data = image_data
             if DEBUG:
-                print(f"DEBUG: Updated last_image_hash to prevent re-capture: {self.last_image_hash}")
+                print(f"DEBUG: Updated last_image_data to prevent re-capture ({len(image_data)} bytes)")
             
             # Use xclip to set image data to clipboard
             subprocess.run(['xclip', '-selection', 'clipboard', '-t', 'image/png'], 
@@ -524,33 +825,44 @@ class ClipSon:
         print("ClipSon started. Press Ctrl+C to stop.")
         print(f"Captured content will be saved to: {self.output_dir}")
         print(f"Maximum entries: {self.max_history} (older files will be automatically deleted)")
-        print(f"Local sync file: {self.local_sync_file}")
         print(f"Local upload file (upload): {self.local_upload_file}")
         print(f"Remote peer files (download): {len(peer_files)} peer(s)")
         for peer_file in peer_files:
             print(f"  - {peer_file}")
-        print(f"Remote check interval: {self.remote_check_interval} seconds")
+        print(f"Remote check interval: {self.remote_check_interval} seconds (backs off up to {self.remote_check_interval * REMOTE_CHECK_BACKOFF_MAX} when idle)")
+        if self.x_display is not None:
+            print("Clipboard monitoring: XFixes owner-change events")
+        else:
+            print(f"Clipboard monitoring: polling every {CLIPBOARD_POLL_INTERVAL} seconds")
         
+        clipboard_changed = True  # Always inspect the clipboard once at startup
         while True:
             try:
                 # Check all remote files for updates
                 remote_content = self.check_all_remote_files_for_updates()
                 # Note: last_clipboard_content is already updated inside check_all_remote_files_for_updates()
                 
-                # Check for clipboard image first (higher priority)
-                if self.has_clipboard_image():
-                    # Check if this is a new image (different from our last captured content)
-                    if not self.last_clipboard_content.startswith("__IMAGE_CONTENT_"):
-                        self.save_clipboard_image()
-                else:
-                    # Check clipboard text content
-                    current_content = self.get_clipboard_content()
-                    if current_content and current_content != self.last_clipboard_content:
-                        self.save_clipboard_text(current_content)
-                        self.last_clipboard_content = current_content
+                if clipboard_changed:
+                    # Query clipboard targets once per tick and reuse them for both checks
+                    targets = self.get_clipboard_targets()
+                    
+                    # Check for clipboard image first (higher priority)
+                    if self.has_clipboard_image(targets):
+                        # Cheap first stage: only read the image when it can be new - the last content
+                        # was not an image, or X reported a real owner change (image replaced by image).
+                        # save_clipboard_image() then dedups against the last image bytes.
+                        if (self.selection_owner_changed
+                                or not self.last_clipboard_content.startswith(b"__IMAGE_CONTENT_")):
+                            self.save_clipboard_image()
+                    elif self.has_clipboard_text(targets):
+                        # Check clipboard text content
+                        current_content = self.get_clipboard_content()
+                        if current_content and current_content != self.last_clipboard_content:
+                            self.save_clipboard_text(current_content)
+                            self.last_clipboard_content = current_content
                 
-                # Wait before next check
-                time.sleep(0.5)
+                # Wait for the next clipboard change (or poll tick)
+                clipboard_changed = self.wait_for_clipboard_change()
                 
             except KeyboardInterrupt:
                 break